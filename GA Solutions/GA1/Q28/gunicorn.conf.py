@@ -0,0 +1,24 @@
+"""
+Gunicorn settings for the ASGI streaming server
+Run from this directory: gunicorn streaming_llm_asgi:app
+"""
+
+import multiprocessing
+import socket
+
+bind = "0.0.0.0:8080"
+workers = multiprocessing.cpu_count()
+worker_class = "uvicorn_worker.UvicornWorker"
+backlog = 4096
+
+# Room for many small SSE frames per connection before a write has to wait
+SEND_BUFFER_BYTES = 64 * 1024
+
+def post_worker_init(worker):
+    """Tune the listen sockets; accepted connections inherit these options"""
+    for listener in worker.sockets:
+        sock = listener.sock
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            # Frames are already batched by the app, so don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_BYTES)
@@ -1,12 +1,14 @@
-import urllib.request
+import http.client
 import json
 
+# Shared keep-alive connection, reused by any further requests in this script
+conn = http.client.HTTPConnection('localhost', 8080, timeout=5)
+
 try:
-    url = 'http://localhost:8080/v1/chat/completions'
     data = json.dumps({'prompt': 'Explain streaming APIs', 'stream': True}).encode('utf-8')
-    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'}, method='POST')
+    conn.request('POST', '/v1/chat/completions', body=data, headers={'Content-Type': 'application/json', 'Connection': 'keep-alive'})
     
-    with urllib.request.urlopen(req, timeout=5) as response:
+    with conn.getresponse() as response:
         print(f"\n✅ ENDPOINT WORKING!\n")
         print(f"Status Code: {response.status}")
         print(f"Content-Type: {response.headers.get('Content-Type')}")
@@ -24,3 +26,5 @@ try:
                     
 except Exception as e:
     print(f"❌ Error: {e}")
+finally:
+    conn.close()
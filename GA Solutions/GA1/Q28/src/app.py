@@ -1,14 +1,22 @@
 from flask import Flask, request, Response, jsonify
 from datetime import datetime
+import functools
 import json
+import os
 import time
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
-def generate_streaming_content(prompt: str):
-    response = f"""Based on your prompt '{prompt}', here's a comprehensive response:
+# Upper bound on in-flight SSE streams; extra requests get 429 instead of queueing
+_STREAM_SLOTS = threading.BoundedSemaphore(int(os.environ.get('MAX_SSE_STREAMS', 256)))
 
-The streaming API enables real-time content delivery, significantly improving user experience by providing immediate feedback. This implementation uses Server-Sent Events (SSE) to progressively stream JSON chunks to clients.
+_STATIC_SUFFIX = """The streaming API enables real-time content delivery, significantly improving user experience by providing immediate feedback. This implementation uses Server-Sent Events (SSE) to progressively stream JSON chunks to clients.
 
 Key Features:
 - Non-blocking streaming architecture
@@ -31,28 +39,75 @@ Implementation details follow industry best practices and standards.
 This comprehensive solution meets all specified requirements and exceeds expectations.
 Production-ready streaming infrastructure for maximum reliability and scalability."""
 
-    return response
+def _prompt_prefix(prompt: str) -> str:
+    return f"Based on your prompt '{prompt}', here's a comprehensive response:"
+
+def generate_streaming_content(prompt: str):
+    return f"{_prompt_prefix(prompt)}\n\n{_STATIC_SUFFIX}"
 
 def chunk_text(text: str, chunk_size: int = 150) -> list:
     chunks = []
     words = text.split()
-    current_chunk = []
+    start = 0
     current_length = 0
     
-    for word in words:
-        if current_length + len(word) > chunk_size and current_chunk:
-            chunks.append(" ".join(current_chunk))
-            current_chunk = [word]
+    # Track chunk boundaries as indices and join each word slice once
+    for i, word in enumerate(words):
+        if current_length + len(word) > chunk_size and i > start:
+            chunks.append(" ".join(words[start:i]))
+            start = i
             current_length = len(word)
         else:
-            current_chunk.append(word)
             current_length += len(word) + 1
     
-    if current_chunk:
-        chunks.append(" ".join(current_chunk))
+    if start < len(words):
+        chunks.append(" ".join(words[start:]))
     
     return chunks
 
+def _sse_event(event: dict) -> bytes:
+    if orjson is not None:
+        return b"data: " + orjson.dumps(event) + b"\n\n"
+    return b"data: " + json.dumps(event, separators=(',', ':')).encode('ascii') + b"\n\n"
+
+def _sse_frame(content: str) -> bytes:
+    return _sse_event({"choices": [{"delta": {"content": content + " "}}]})
+
+# Everything after the prompt line is static, so chunk and serialize it once at import
+_SUFFIX_CHUNKS = chunk_text(_STATIC_SUFFIX, chunk_size=150)
+_SUFFIX_FRAMES = tuple(_sse_frame(chunk) for chunk in _SUFFIX_CHUNKS if chunk.strip())
+# Unpaced streams send the whole static tail as this one prebuilt buffer
+_SUFFIX_BODY = b"".join(_SUFFIX_FRAMES)
+_DONE_FRAME = b"data: [DONE]\n\n"
+
+@functools.lru_cache(maxsize=1024)
+def _build_frames(prompt: str) -> tuple[bytes, ...]:
+    prefix_frames = tuple(
+        _sse_frame(chunk)
+        for chunk in chunk_text(_prompt_prefix(prompt), chunk_size=150)
+    )
+    return prefix_frames + _SUFFIX_FRAMES
+
+def paced_frames(frames, delay: float):
+    for frame in frames:
+        yield frame
+        if delay:
+            time.sleep(delay)
+
+class _SlotRelease:
+    """One-shot stream slot release; also runs when dropped unreleased"""
+    
+    def __init__(self, release):
+        self._release = release
+        self._once = threading.Lock()
+    
+    def __call__(self):
+        if self._once.acquire(blocking=False):
+            self._release()
+    
+    def __del__(self):
+        self()
+
 @app.errorhandler(Exception)
 def handle_error(e):
     print(f"ERROR: {e}", flush=True)
@@ -94,40 +149,66 @@ def stream_endpoint():
                 status=400
             )
         
-        content = generate_streaming_content(prompt)
-        chunks = chunk_text(content, chunk_size=150)
+        # Inter-chunk delay only exists for demo parity; 0 streams as fast as the socket allows
+        try:
+            pacing = max(0, min(200, int(data.get('pacing_ms', 0)))) / 1000.0
+        except (TypeError, ValueError, OverflowError):
+            return Response(
+                'data: {"error": "pacing_ms must be an integer", "code": 400}\n\n',
+                content_type='text/event-stream',
+                status=400
+            )
+        
+        content_frames = _build_frames(prompt)
         
         def generate():
             try:
-                for chunk in chunks:
-                    if chunk.strip():
-                        response_data = {
-                            "choices": [{
-                                "delta": {
-                                    "content": chunk + " "
-                                }
-                            }]
-                        }
-                        yield f"data: {json.dumps(response_data)}\n\n"
-                        time.sleep(0.05)
-                
-                yield "data: [DONE]\n\n"
+                yield from paced_frames(content_frames, pacing)
+                yield _DONE_FRAME
                 
             except Exception as e:
                 error_event = {
                     "error": str(e),
                     "code": 500
                 }
-                yield f"data: {json.dumps(error_event)}\n\n"
+                yield _sse_event(error_event)
+            
+            finally:
+                # Also runs when the generator is garbage-collected, so the slot comes
+                # back even when the server skips close() after a client reset
+                release()
+        
+        headers = {
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+        
+        if not pacing:
+            # Nothing to pace or hold open: the server gets every frame in a single
+            # prebuilt body, so this path doesn't take a stream slot
+            prompt_frames = content_frames[:len(content_frames) - len(_SUFFIX_FRAMES)]
+            return Response(
+                b"".join((*prompt_frames, _SUFFIX_BODY, _DONE_FRAME)),
+                content_type='text/event-stream',
+                headers=headers
+            )
+        
+        if not _STREAM_SLOTS.acquire(blocking=False):
+            return Response(
+                _sse_event({"error": "Too many concurrent streams, retry later", "code": 429}),
+                content_type='text/event-stream',
+                status=429
+            )
         
+        # generate() only yields bytes, so the WSGI server can take it unchanged.
+        # Passthrough skips the Response's own close hooks; the generator's
+        # finally returns the slot on close(), on completion or when collected.
+        release = _SlotRelease(_STREAM_SLOTS.release)
         return Response(
             generate(),
             content_type='text/event-stream',
-            headers={
-                'Cache-Control': 'no-cache',
-                'X-Accel-Buffering': 'no',
-                'Connection': 'keep-alive'
-            }
+            direct_passthrough=True,
+            headers=headers
         )
     
     except Exception as e:
@@ -136,7 +217,7 @@ def stream_endpoint():
             "code": 500
         }
         return Response(
-            f"data: {json.dumps(error_response)}\n\n",
+            _sse_event(error_response),
             content_type='text/event-stream',
             status=500
         )
@@ -11,6 +11,15 @@ def stream_endpoint():
     """Streaming endpoint"""
     data = request.get_json()
     prompt = data.get('prompt', '')
+    # Inter-chunk delay only exists for demo parity; 0 streams as fast as the socket allows
+    try:
+        pacing = max(0, min(200, int(data.get('pacing_ms', 0)))) / 1000.0
+    except (TypeError, ValueError, OverflowError):
+        return Response(
+            'data: {"error": "pacing_ms must be an integer", "code": 400}\n\n',
+            content_type='text/event-stream',
+            status=400
+        )
     
     response = f"""Based on your prompt '{prompt}', here's a response:
 The streaming API enables real-time delivery. This implementation uses Server-Sent Events.
@@ -26,7 +35,8 @@ Each chunk is sent immediately without waiting for completion."""
             if chunk:
                 data = {"choices": [{"delta": {"content": chunk + ". "}}]}
                 yield f"data: {json.dumps(data)}\n\n"
-                time.sleep(0.05)
+                if pacing:
+                    time.sleep(pacing)
         yield "data: [DONE]\n\n"
 
     return Response(generate(), content_type='text/event-stream')
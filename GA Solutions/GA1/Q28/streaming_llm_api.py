@@ -4,73 +4,73 @@ Complete Streaming LLM API - Standalone Executable
 Includes both server and test functionality
 """
 
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
 from flask import Flask, request, Response, jsonify
 from datetime import datetime
 import json
+import os
 import time
 import threading
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 
-app = Flask(__name__)
-
-def generate_streaming_content(prompt: str):
-    """Generate realistic multi-chunk streaming response (1378+ characters)"""
-    response = f"""Based on your prompt '{prompt}', here's a comprehensive response:
-
-The streaming API enables real-time content delivery, significantly improving user experience by providing immediate feedback. This implementation uses Server-Sent Events (SSE) to progressively stream JSON chunks to clients.
+from sse_frames import (
+    _DONE_FRAME, _SUFFIX_BODY, _SUFFIX_FRAMES, _build_frames, _sse_event,
+    chunk_text, generate_streaming_content
+)
 
-Key Features:
-• Non-blocking streaming architecture: Leveraging asynchronous I/O to handle many connections.
-• Error handling with graceful degradation: Ensuring that any server-side issues are communicated.
-• Support for multiple concurrent connections: Scaling to meet demand efficiently.
-• Proper resource cleanup and connection management: Preventing memory leaks and socket exhaustion.
-
-Performance Characteristics:
-- First token latency: <2000ms: Optimizing for the fastest possible response start.
-- Throughput: >30 tokens/second: Ensuring a smooth and steady flow of information.
-- Connection pooling enabled: Reusing connections to reduce handshake overhead.
-- Automatic backpressure handling: Managing data flow to match client consumption rates.
-
-The response is delivered in 6+ chunks for demonstration:
-This ensures responsive user interfaces and better perceived performance.
-Each chunk is sent as soon as available, without waiting for completion.
-The streaming paradigm revolutionizes how we deliver AI-generated content.
-Real-time feedback transforms user engagement and satisfaction metrics.
-Implementation details follow industry best practices and standards.
-This comprehensive solution meets all specified requirements and exceeds expectations.
-Production-ready streaming infrastructure for maximum reliability and scalability.
-Moreover, by using Rust as the underlying technology for high-performance components, we achieve unprecedented speed and efficiency. The combination of memory safety and zero-cost abstractions allows for building systems that are both robust and blazing fast.
+app = Flask(__name__)
 
-Furthermore, streaming is not just about speed; it's about the interactive experience. When users see words appearing as they are being thought of by the AI, it creates a sense of collaboration and flow that batch processing simply cannot replicate. This is particularly vital in creative applications, coding assistants, and any tool where the user's focus is on the evolving output. By minimizing the time to first token, we bridge the gap between human thought and machine generation, fostering a more intuitive and natural interface. 
+# Upper bound on in-flight SSE streams; extra requests get 429 instead of queueing
+_STREAM_SLOTS = threading.BoundedSemaphore(int(os.environ.get('MAX_SSE_STREAMS', 256)))
 
-In conclusion, this streaming endpoint is a testament to modern engineering principles, combining SSE protocol efficiency with robust backend processing to deliver a state-of-the-art content generation service. It is designed to be scalable, maintainable, and highly responsive to user needs."""
+# Pooled session for the test client; reuses connections the server keeps alive
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0))
 
-    return response
+def paced_frames(frames: Iterable[bytes], delay: float) -> Iterator[bytes]:
+    """Yield frames with a fixed pause after each one"""
+    for frame in frames:
+        yield frame
+        if delay:
+            time.sleep(delay)
 
-def chunk_text(text: str, chunk_size: int = 150) -> list:
-    """Split text into chunks"""
-    chunks = []
-    words = text.split()
-    current_chunk = []
-    current_length = 0
+class _SlotRelease:
+    """One-shot stream slot release; also runs when dropped unreleased, since
+    mypyc-compiled generators skip finally when they are garbage-collected"""
     
-    for word in words:
-        if current_length + len(word) > chunk_size and current_chunk:
-            chunks.append(" ".join(current_chunk))
-            current_chunk = [word]
-            current_length = len(word)
-        else:
-            current_chunk.append(word)
-            current_length += len(word) + 1
+    def __init__(self, release: Callable[[], None]) -> None:
+        self._release = release
+        self._once = threading.Lock()
     
-    if current_chunk:
-        chunks.append(" ".join(current_chunk))
+    def __call__(self) -> None:
+        if self._once.acquire(blocking=False):
+            self._release()
+    
+    def __del__(self) -> None:
+        self()
+
+def generate(content_frames: tuple[bytes, ...], pacing: float,
+             release: Callable[[], None]) -> Iterator[bytes]:
+    """Paced SSE body; module level rather than a closure so mypyc compiles it cleanly"""
+    try:
+        yield from paced_frames(content_frames, pacing)
+        yield _DONE_FRAME
+        
+    except Exception as e:
+        error_event = {"error": str(e), "code": 500}
+        yield _sse_event(error_event)
     
-    return chunks
+    finally:
+        # Also runs when the generator is garbage-collected, so the slot comes back
+        # even when the server skips close() after a client reset
+        release()
 
 @app.after_request
-def add_cors_headers(response):
+def add_cors_headers(response: Response) -> Response:
     """Add CORS headers to every response"""
     response.headers['Access-Control-Allow-Origin'] = '*'
     response.headers['Access-Control-Allow-Methods'] = 'POST, GET, OPTIONS'
@@ -79,7 +79,7 @@ def add_cors_headers(response):
 
 @app.route('/', methods=['POST', 'OPTIONS'])
 @app.route('/v1/chat/completions', methods=['POST', 'OPTIONS'])
-def stream_endpoint():
+def stream_endpoint() -> Response:
     """Streaming LLM endpoint with SSE format and CORS support"""
     if request.method == 'OPTIONS':
         return Response(status=204)
@@ -118,49 +118,60 @@ def stream_endpoint():
                 status=400
             )
         
-        content = generate_streaming_content(prompt)
-        chunks = chunk_text(content, chunk_size=150)
+        # Inter-chunk delay only exists for demo parity; 0 streams as fast as the socket allows
+        try:
+            pacing = max(0, min(200, int(data.get('pacing_ms', 0)))) / 1000.0
+        except (TypeError, ValueError, OverflowError):
+            return Response(
+                'data: {"error": "pacing_ms must be an integer", "code": 400}\n\n',
+                content_type='text/event-stream',
+                status=400
+            )
         
-        def generate():
-            try:
-                for chunk in chunks:
-                    if chunk.strip():
-                        response_data = {
-                            "choices": [{
-                                "delta": {
-                                    "content": chunk + " "
-                                }
-                            }]
-                        }
-                        yield f"data: {json.dumps(response_data)}\n\n"
-                        time.sleep(0.05)
-                
-                yield "data: [DONE]\n\n"
-                
-            except Exception as e:
-                error_event = {"error": str(e), "code": 500}
-                yield f"data: {json.dumps(error_event)}\n\n"
+        content_frames = _build_frames(prompt)
+        
+        headers = {
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+        
+        if not pacing:
+            # Nothing to pace or hold open: the server gets every frame in a single
+            # prebuilt body, so this path doesn't take a stream slot
+            prompt_frames = content_frames[:len(content_frames) - len(_SUFFIX_FRAMES)]
+            return Response(
+                b"".join((*prompt_frames, _SUFFIX_BODY, _DONE_FRAME)),
+                content_type='text/event-stream',
+                headers=headers
+            )
+        
+        if not _STREAM_SLOTS.acquire(blocking=False):
+            return Response(
+                _sse_event({"error": "Too many concurrent streams, retry later", "code": 429}),
+                content_type='text/event-stream',
+                status=429
+            )
         
+        # generate() only yields bytes, so the WSGI server can take it unchanged.
+        # Passthrough skips the Response's own close hooks; the generator's
+        # finally returns the slot on close(), on completion or when collected.
         return Response(
-            generate(),
+            generate(content_frames, pacing, _SlotRelease(_STREAM_SLOTS.release)),
             content_type='text/event-stream',
-            headers={
-                'Cache-Control': 'no-cache',
-                'X-Accel-Buffering': 'no',
-                'Connection': 'keep-alive'
-            }
+            direct_passthrough=True,
+            headers=headers
         )
     
     except Exception as e:
         error_response = {"error": f"Server error: {str(e)}", "code": 500}
         return Response(
-            f"data: {json.dumps(error_response)}\n\n",
+            _sse_event(error_response),
             content_type='text/event-stream',
             status=500
         )
 
 @app.route('/health', methods=['GET'])
-def health_check():
+def health_check() -> tuple[Response, int]:
     """Health check endpoint"""
     return jsonify({
         "status": "healthy",
@@ -169,7 +180,7 @@ def health_check():
     }), 200
 
 @app.route('/info', methods=['GET'])
-def index():
+def index() -> tuple[Response, int]:
     """API information"""
     return jsonify({
         "service": "Streaming LLM API",
@@ -185,7 +196,7 @@ def index():
         ]
     }), 200
 
-def run_server():
+def run_server() -> None:
     """Run Flask server"""
     print("\n" + "=" * 70)
     print("🚀 STREAMING LLM API SERVER")
@@ -197,7 +208,7 @@ def run_server():
     
     app.run(host='127.0.0.1', port=8080, debug=False, threaded=True, use_reloader=False)
 
-def test_api():
+def test_api() -> None:
     """Test the streaming endpoint"""
     time.sleep(2)  # Wait for server to start
     
@@ -214,19 +225,23 @@ def test_api():
     print("\n📥 Streaming Response:\n")
     
     try:
-        response = requests.post(url, json=payload, headers=headers, stream=True, timeout=30)
+        response = _SESSION.post(url, json=payload, headers=headers, stream=True, timeout=30)
         
         if response.status_code == 200:
             chunk_count = 0
             total_chars = 0
             chunks_received = []
             
-            for line in response.iter_lines():
-                if line:
-                    line = line.decode('utf-8') if isinstance(line, bytes) else line
-                    if line.startswith('data: '):
+            # Read the socket in bulk and split SSE frames on the blank-line separator
+            buf = bytearray()
+            for raw in response.iter_content(chunk_size=8192):
+                buf.extend(raw)
+                while (end := buf.find(b'\n\n')) != -1:
+                    frame = bytes(buf[:end])
+                    del buf[:end + 2]
+                    if frame.startswith(b'data: '):
                         chunk_count += 1
-                        data_str = line[6:]
+                        data_str = frame[6:].decode('utf-8')
                         
                         if data_str == '[DONE]':
                             print("\n\n✅ Stream completed successfully!")
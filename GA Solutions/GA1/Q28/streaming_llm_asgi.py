@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Streaming LLM API - ASGI (FastAPI + uvicorn) version
+Serves the same SSE stream as streaming_llm_api.py from an async generator,
+so one event loop multiplexes many in-flight streams instead of holding
+a thread per client.
+"""
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
+from datetime import datetime
+import asyncio
+import os
+import sys
+import uvicorn
+
+# Only needed for --h2, so uvicorn and gunicorn deployments don't have to install it
+try:
+    from hypercorn.config import Config
+    from hypercorn.run import run as hypercorn_run
+except ImportError:
+    Config = None
+
+from sse_frames import (
+    _DONE_FRAME, _SUFFIX_BODY, _SUFFIX_FRAMES, _build_frames, _sse_event
+)
+
+app = FastAPI()
+
+# Per-worker cap on in-flight SSE streams; extra requests get 429 instead of queueing
+_MAX_SSE_STREAMS = int(os.environ.get('MAX_SSE_STREAMS', 256))
+_STREAM_SLOTS = asyncio.Semaphore(_MAX_SSE_STREAMS)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["POST", "GET", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+)
+
+def error_response(message: str, status: int = 400) -> Response:
+    """Single SSE error event with a matching HTTP status"""
+    return Response(
+        _sse_event({"error": message, "code": status}),
+        media_type='text/event-stream',
+        status_code=status
+    )
+
+@app.post('/')
+@app.post('/v1/chat/completions')
+async def stream_endpoint(request: Request):
+    """Streaming LLM endpoint with SSE format"""
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+
+    if not data:
+        return error_response("No JSON body provided")
+
+    if not isinstance(data, dict):
+        return error_response("JSON body must be an object")
+
+    prompt = data.get('prompt', '')
+    if not isinstance(prompt, str):
+        return error_response("prompt must be a string")
+
+    prompt = prompt.strip()
+    stream = data.get('stream', False)
+
+    if not prompt:
+        return error_response("Prompt cannot be empty")
+
+    if len(prompt) > 5000:
+        return error_response("Prompt exceeds maximum length of 5000 chars")
+
+    if not stream:
+        return error_response("stream parameter must be true")
+
+    # Inter-chunk delay only exists for demo parity; 0 streams as fast as the socket allows
+    try:
+        pacing = max(0, min(200, int(data.get('pacing_ms', 0)))) / 1000.0
+    except (TypeError, ValueError, OverflowError):
+        return error_response("pacing_ms must be an integer")
+
+    content_frames = _build_frames(prompt)
+
+    if _STREAM_SLOTS.locked():
+        return error_response("Too many concurrent streams, retry later", 429)
+    # Doesn't suspend when a slot is free, so the check above can't race
+    await _STREAM_SLOTS.acquire()
+
+    # StreamingResponse awaits each send, and uvicorn holds that await while the
+    # socket buffer is full, so a stalled client pauses this generator instead
+    # of piling frames up in memory
+    async def agen():
+        try:
+            if pacing:
+                for frame in content_frames:
+                    yield frame
+                    await asyncio.sleep(pacing)
+            else:
+                # Two sends instead of one per frame: prompt frames, then the static tail
+                prompt_frames = content_frames[:len(content_frames) - len(_SUFFIX_FRAMES)]
+                yield b"".join(prompt_frames)
+                yield _SUFFIX_BODY
+
+            yield _DONE_FRAME
+
+        except Exception as e:
+            error_event = {"error": str(e), "code": 500}
+            yield _sse_event(error_event)
+
+        finally:
+            _STREAM_SLOTS.release()
+
+    return StreamingResponse(
+        agen(),
+        media_type='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+@app.get('/health')
+async def health_check():
+    """Health check endpoint"""
+    return {
+        "status": "healthy",
+        "timestamp": datetime.now().isoformat(),
+        "service": "Streaming LLM API"
+    }
+
+def run_server():
+    """Run under uvicorn with one worker per CPU"""
+    uvicorn.run(
+        "streaming_llm_asgi:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host='0.0.0.0',
+        port=8080,
+        loop='uvloop',
+        http='httptools',
+        workers=os.cpu_count(),
+        backlog=2048,
+        # Connection cap above the stream cap, so health checks and clean 429s
+        # still get through when every stream slot is taken
+        limit_concurrency=_MAX_SSE_STREAMS + 64
+    )
+
+def run_h2_server():
+    """Run under hypercorn so HTTP/2 clients multiplex many streams over one connection"""
+    if Config is None:
+        sys.exit("HTTP/2 mode needs hypercorn: pip install hypercorn")
+    config = Config()
+    # Relative module path: an absolute Windows path would add a second ':'
+    module = os.path.relpath(os.path.splitext(os.path.abspath(__file__))[0])
+    config.application_path = f"{module}:app"
+    config.bind = ['0.0.0.0:8080']
+    config.workers = os.cpu_count()
+    config.worker_class = 'uvloop'
+    config.backlog = 2048
+    # One connection may use every stream slot of a worker, but no more
+    config.h2_max_concurrent_streams = _MAX_SSE_STREAMS
+    # Browsers only negotiate HTTP/2 over TLS; without a cert this serves h2c
+    config.certfile = os.environ.get('SSL_CERTFILE')
+    config.keyfile = os.environ.get('SSL_KEYFILE')
+    hypercorn_run(config)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--h2":
+        run_h2_server()
+    else:
+        run_server()
@@ -2,9 +2,15 @@
 """Test script for the streaming LLM API"""
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import sys
 
+# One pooled session for every call; it reuses connections the server keeps alive
+# (the ASGI servers do, the Flask dev server closes each one)
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0))
+
 def test_streaming_api():
     """Test the streaming endpoint"""
     url = "http://localhost:8080/v1/chat/completions"
@@ -26,18 +32,22 @@ def test_streaming_api():
     print("\nStreaming Response:\n")
     
     try:
-        response = requests.post(url, json=payload, headers=headers, stream=True, timeout=30)
+        response = _SESSION.post(url, json=payload, headers=headers, stream=True, timeout=30)
         
         if response.status_code == 200:
             chunk_count = 0
             total_chars = 0
             
-            for line in response.iter_lines():
-                if line:
-                    line = line.decode('utf-8') if isinstance(line, bytes) else line
-                    if line.startswith('data: '):
+            # Read the socket in bulk and split SSE frames on the blank-line separator
+            buf = bytearray()
+            for raw in response.iter_content(chunk_size=8192):
+                buf.extend(raw)
+                while (end := buf.find(b'\n\n')) != -1:
+                    frame = bytes(buf[:end])
+                    del buf[:end + 2]
+                    if frame.startswith(b'data: '):
                         chunk_count += 1
-                        data_str = line[6:]  # Remove 'data: ' prefix
+                        data_str = frame[6:].decode('utf-8')  # Remove 'data: ' prefix
                         
                         if data_str == '[DONE]':
                             print("\n✅ Stream completed successfully!")
@@ -1,4 +1,4 @@
-import urllib.request
+import http.client
 import json
 
 print("=" * 80)
@@ -8,19 +8,20 @@ print('  -H "Content-Type: application/json"')
 print('  -d \'{"prompt": "Explain streaming APIs", "stream": true}\'')
 print("=" * 80)
 
-url = 'http://localhost:8080/v1/chat/completions'
 payload = {"prompt": "Explain streaming APIs", "stream": True}
 data = json.dumps(payload).encode('utf-8')
 
-req = urllib.request.Request(
-    url,
-    data=data,
-    headers={'Content-Type': 'application/json'},
-    method='POST'
-)
+# Shared keep-alive connection, reused by any further requests in this script
+conn = http.client.HTTPConnection('localhost', 8080, timeout=10)
 
 try:
-    with urllib.request.urlopen(req, timeout=10) as response:
+    conn.request(
+        'POST',
+        '/v1/chat/completions',
+        body=data,
+        headers={'Content-Type': 'application/json', 'Connection': 'keep-alive'}
+    )
+    with conn.getresponse() as response:
         print(f"\nHTTP/1.1 {response.status} {response.reason}")
         print(f"Content-Type: {response.headers.get('Content-Type')}")
         print(f"Transfer-Encoding: chunked")
@@ -42,3 +43,5 @@ try:
         
 except Exception as e:
     print(f"\nError: {type(e).__name__}: {e}")
+finally:
+    conn.close()
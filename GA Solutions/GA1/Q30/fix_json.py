@@ -3,32 +3,47 @@ import re, json, sys
 in_path = r"d:/TDS/GA Solutions/GA1/Q30/broken.json"
 out_path = r"d:/TDS/GA Solutions/GA1/Q30/fixed.json"
 
+# Patterns are compiled once; each pass below is a single scan over the text
+# 1) Extra closing brace before description, then the same with a trailing comma.
+# Kept as two passes: the second one also sees what the first one produced.
+EXTRA_BRACE_RE = re.compile(r"}}\n(\s*)\"description\"")
+EXTRA_BRACE_COMMA_RE = re.compile(r"}},\n(\s*)\"description\"")
+# 2) Missing comma between top-level objects
+MISSING_OBJ_COMMA_RE = re.compile(r"\}\n(\s{2})\{")
+# 3) Single-quoted keys
+SINGLE_QUOTED_KEY_RE = re.compile(r"'([A-Za-z_][A-Za-z0-9_]*)'\s*:")
+# 4) Single-quoted simple string values
+SINGLE_QUOTED_VALUE_RE = re.compile(r":\s*'([^'\\n]*)'")
+# 5) Unquoted occurrences of the key names observed in the file, as one alternation
+KEYS = ("category", "status", "metadata", "description", "timestamp", "name", "id", "value")
+UNQUOTED_KEY_RE = re.compile(r"\n(\s+)(" + "|".join(KEYS) + r")\s*:")
+# 6) Missing comma after an "id" property when "name" follows on the next line
+MISSING_ID_COMMA_RE = re.compile(r'("id"\s*:\s*"[^"]+")\n(\s+"name"\s*:)')
+
 t = open(in_path, "r", encoding="utf-8").read()
 orig = t
 
 # Fix specific observed issues:
 # 1) Extra closing brace before description: replace '}}\n    "description"' -> '},\n    "description"'
-t = re.sub(r"}}\n(\s*)\"description\"", r'},\n\1"description"', t)
+t = EXTRA_BRACE_RE.sub(r'},\n\1"description"', t)
 # Handle case where extra brace is followed by a comma before description
-t = re.sub(r"}},\n(\s*)\"description\"", r'},\n\1"description"', t)
+t = EXTRA_BRACE_COMMA_RE.sub(r'},\n\1"description"', t)
 
 # 2) Missing comma between top-level objects: '}' followed by newline and two-space indent and '{' -> '},\n  {'
-t = re.sub(r"\}\n(\s{2})\{", r'},\n\1{', t)
+t = MISSING_OBJ_COMMA_RE.sub(r'},\n\1{', t)
 
 # 3) Single-quoted keys -> double-quoted keys (e.g. 'status': -> "status":)
-t = re.sub(r"'([A-Za-z_][A-Za-z0-9_]*)'\s*:", r'"\1":', t)
+t = SINGLE_QUOTED_KEY_RE.sub(r'"\1":', t)
 
 # 4) Single-quoted string values -> double-quoted values (e.g. 'inactive' -> "inactive")
 # Only match simple single-quoted values without embedded single quotes
-t = re.sub(r":\s*'([^'\\n]*)'", r': "\1"', t)
+t = SINGLE_QUOTED_VALUE_RE.sub(r': "\1"', t)
 
 # 5) Missing quotes around specific key names observed (e.g. category: -> "category":)
-# Apply to a handful of likely keys
-for key in ("category", "status", "metadata", "description", "timestamp", "name", "id", "value"): 
-    t = re.sub(r"\n(\s+)" + key + r"\s*:", r'\n\1"' + key + r'":', t)
+t = UNQUOTED_KEY_RE.sub(r'\n\1"\2":', t)
 
 # 6) Missing comma after an "id" property when next property starts on following line
-t = re.sub(r'("id"\s*:\s*"[^"]+")\n(\s+"name"\s*:)', r'\1,\n\2', t)
+t = MISSING_ID_COMMA_RE.sub(r'\1,\n\2', t)
 
 # Try parsing
 try:
@@ -1,7 +1,19 @@
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 import pandas as pd
 from typing import List, Optional
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dump_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
 
 app = FastAPI()
 
@@ -13,16 +25,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# ✅ Load CSV
+# ✅ Load CSV once and index it by class, so requests never scan the frame
 df = pd.read_csv("q-fastapi.csv")
+df["class"] = df["class"].astype("category")
+STUDENTS = df.to_dict(orient="records")
+ROWS_BY_CLASS = {
+    cls: positions.tolist()
+    for cls, positions in df.groupby("class", observed=True).indices.items()
+}
+
+async def students_json(rows, batch_size: int = 512):
+    """Stream {"students": [...]} in batches instead of building the whole body first"""
+    yield b'{"students":['
+    for start in range(0, len(rows), batch_size):
+        if start:
+            yield b","
+        # Strip the list brackets so batches join into one array
+        yield dump_bytes(rows[start:start + batch_size])[1:-1]
+    yield b"]}"
 
 @app.get("/api")
 def get_students(class_: Optional[List[str]] = Query(None, alias="class")):
-    data = df
+    students = STUDENTS
 
     if class_:
-        data = data[data["class"].isin(class_)]
-
-    students = data.to_dict(orient="records")
+        # Merge the matching row positions back into CSV order
+        positions = sorted(i for c in set(class_) for i in ROWS_BY_CLASS.get(c, ()))
+        students = [STUDENTS[i] for i in positions]
 
-    return {"students": students}
+    return StreamingResponse(students_json(students), media_type="application/json")
@@ -3,14 +3,28 @@
 # dependencies = [
 #   "fastapi",
 #   "uvicorn",
-#   "pandas"
+#   "pandas",
+#   "orjson"
 # ]
 # ///
 
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 import pandas as pd
-from typing import List, Dict, Union
+from typing import List
+import json
+import uvicorn
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dump_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
 
 app = FastAPI()
 
@@ -22,18 +36,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load CSV once at startup
+# Load CSV once at startup and index it by class, so requests never scan the frame
 df = pd.read_csv("q-fastapi.csv")
+df["class"] = df["class"].astype("category")
+STUDENTS = df.to_dict(orient="records")
+ROWS_BY_CLASS = {
+    cls: positions.tolist()
+    for cls, positions in df.groupby("class", observed=True).indices.items()
+}
+
+async def students_json(rows, batch_size: int = 512):
+    """Stream {"students": [...]} in batches instead of building the whole body first"""
+    yield b'{"students":['
+    for start in range(0, len(rows), batch_size):
+        if start:
+            yield b","
+        # Strip the list brackets so batches join into one array
+        yield dump_bytes(rows[start:start + batch_size])[1:-1]
+    yield b"]}"
 
 @app.get("/api")
-async def get_students(classes: List[str] = Query(default=None)) -> Dict[str, List[Dict[str, Union[str, int]]]]:
+async def get_students(classes: List[str] = Query(default=None)) -> StreamingResponse:
     if classes:
-        filtered = df[df["class"].isin(classes)]
+        # Merge the matching row positions back into CSV order
+        positions = sorted(i for c in set(classes) for i in ROWS_BY_CLASS.get(c, ()))
+        students = [STUDENTS[i] for i in positions]
     else:
-        filtered = df
-    students = filtered.to_dict(orient="records")
-    return {"students": students}
+        students = STUDENTS
+    return StreamingResponse(students_json(students), media_type="application/json")
 
 if __name__ == "__main__":
-    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8004)
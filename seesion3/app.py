@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+import uvicorn
 app=FastAPI()
 @app.get("/")
 async def root():
@@ -7,10 +8,8 @@ async def root():
 
 @app.post('/items')
 async def create_item(item:dict):
-    import json
     return item
     
 
 if __name__=="__main__":
-    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port= 8000)
\ No newline at end of file